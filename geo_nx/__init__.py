@@ -12,6 +12,6 @@ from geo_nx.geograph import GeoGraph
 from geo_nx.convert import from_geopandas_edgelist, from_geopandas_nodelist
 from geo_nx.convert import to_geopandas_edgelist, to_geopandas_nodelist
 from geo_nx.convert import project_graph
-from geo_nx.algorithms import compose
+from geo_nx.algorithms import compose, compose_all
 
 from geo_nx.utils import geom_to_crs, cast_id
@@ -34,3 +34,43 @@ def compose(geo_g, geo_h):
     geo_gh = nx.compose(geo_g, geo_h)
     geo_gh.graph['crs'] = geo_g.graph['crs']
     return geo_gh
+
+
+def compose_all(geo_graphs):
+    """Returns the composition of all GeoGraph.
+
+    Composition is the simple union of the node sets and edge sets.
+    The node sets of the supplied graphs need not be disjoint.
+
+    Parameters
+    ----------
+    geo_graphs : iterable
+       Iterable of GeoGraph
+
+    Returns
+    -------
+    A new GeoGraph with the same type and crs as the first GeoGraph
+
+    Notes
+    -----
+    The crs of all the GeoGraph have to be identical.
+    Graph, edge, and node attributes are propagated to the composition.
+    If a graph attribute is present in multiple graphs, then the value
+    from the last graph in the list with that attribute is used.
+    """
+    geo_graphs = iter(geo_graphs)
+    try:
+        geo_first = next(geo_graphs)
+    except StopIteration:
+        raise ValueError("cannot apply compose_all to an empty list") from None
+    crs = geo_first.graph['crs']
+    geo_all = geo_first.__class__()
+    for geo_g in (geo_first, *geo_graphs):
+        if geo_g.graph['crs'] != crs:
+            raise GeoGraphError(
+                "all the GeoGraph must have the same crs attribute.")
+        geo_all.graph.update(geo_g.graph)
+        geo_all.add_nodes_from(geo_g.nodes(data=True))
+        geo_all.add_edges_from(geo_g.edges(data=True))
+    geo_all.graph['crs'] = crs
+    return geo_all
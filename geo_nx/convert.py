@@ -12,8 +12,7 @@ The conversion follows two principles:
 
 """
 import math
-import pandas as pd
-import numpy as np
+import shapely
 import geopandas as gpd
 import networkx as nx
 import geo_nx as gnx
@@ -50,26 +49,35 @@ def from_geopandas_nodelist(node_gdf, node_id=None, node_attr=None):
     GeoGraph
         Empty GeoGraph with nodes of the GeoDataFrame.
     '''
+    geo_gr = gnx.GeoGraph(crs=node_gdf.crs)
+    geo_gr.add_nodes_from(_nodes_from_gdf(node_gdf, node_id, node_attr))
+    return geo_gr
+
+
+def _nodes_from_gdf(node_gdf, node_id, node_attr):
+    '''Return the (node, attributes) list of a nodes GeoDataFrame
+    (see `from_geopandas_nodelist` for the parameters).'''
     match node_attr:
         case True:
             new_node_attr = list(node_gdf.columns)
         case list() | tuple():
-            new_node_attr = list(set(node_attr + [GEOM]))
+            new_node_attr = list(dict.fromkeys([*node_attr, GEOM]))
         case str():
             new_node_attr = [GEOM, node_attr]
         case _:
             new_node_attr = [GEOM]
     if node_id:
-        new_node_attr = list(set(new_node_attr + [node_id]))
-    dic = node_gdf.loc[:, new_node_attr].to_dict(orient='records')
-    if not node_id or node_id not in node_gdf.columns:
-        nx_lis = [(idx, dict(item for item in row.items()))
-                  for idx, row in enumerate(dic)]
-    else:
-        nx_lis = [(row[node_id], dict(item for item in row.items() if item[0] != node_id and not (isinstance(item[1], float) and math.isnan(item[1]))))
-                  for row in dic]
-    geo_gr = nx.empty_graph(nx_lis)
-    return gnx.GeoGraph(geo_gr, crs=node_gdf.crs)
+        new_node_attr = list(dict.fromkeys([*new_node_attr, node_id]))
+    attrs = [attr for attr in new_node_attr if attr != node_id]
+    ids = node_gdf[node_id].tolist() if node_id else range(len(node_gdf))
+    if attrs == [GEOM]:
+        return [(idx, {GEOM: geom}) for idx, geom in zip(ids, node_gdf[GEOM].tolist())]
+    rows = zip(*[node_gdf[attr].tolist() for attr in attrs])
+    if not node_id or not any(node_gdf[attr].hasnans for attr in attrs):
+        return [(idx, dict(zip(attrs, row))) for idx, row in zip(ids, rows)]
+    return [(idx, {attr: val for attr, val in zip(attrs, row)
+                   if not (isinstance(val, float) and val != val)})
+            for idx, row in zip(ids, rows)]
 
 
 def from_geopandas_edgelist(edge_gdf, source='source', target='target',
@@ -113,14 +121,14 @@ def from_geopandas_edgelist(edge_gdf, source='source', target='target',
         GeoGraph with edges of the GeoDataFrame.'''
 
     n_gdf_ok = node_gdf is not None
-    e_gdf = edge_gdf.copy()
-    n_gdf = node_gdf.copy() if n_gdf_ok else None
+    e_gdf = edge_gdf
+    n_gdf = node_gdf
 
     match edge_attr:
         case True:
             new_edge_attr = True
         case list() | tuple():
-            new_edge_attr = list(set(edge_attr + [GEOM, WEIGHT]))
+            new_edge_attr = list(dict.fromkeys([*edge_attr, GEOM, WEIGHT]))
         case str():
             new_edge_attr = [GEOM, WEIGHT, edge_attr]
         case _:
@@ -135,13 +143,16 @@ def from_geopandas_edgelist(edge_gdf, source='source', target='target',
             e_gdf, source=source, target=target)
 
     if WEIGHT not in e_gdf.columns:
-        e_gdf[WEIGHT] = e_gdf[GEOM].length
-    geo_gr = nx.from_pandas_edgelist(e_gdf, edge_attr=new_edge_attr)
+        e_gdf = e_gdf.assign(**{WEIGHT: e_gdf[GEOM].length})
     crs = e_gdf.crs if e_gdf.crs else (n_gdf.crs if n_gdf_ok else None)
+    if n_gdf.crs != crs:
+        raise gnx.geograph.GeoGraphError(
+            "edge_gdf and node_gdf must both have the same crs.")
+    geo_gr = nx.from_pandas_edgelist(e_gdf, source=source, target=target,
+                                     edge_attr=new_edge_attr, create_using=gnx.GeoGraph)
     geo_gr.graph['crs'] = crs.to_epsg()
-    node_gr = gnx.from_geopandas_nodelist(
-        n_gdf, node_id=node_id, node_attr=node_attr)
-    return gnx.compose(gnx.GeoGraph(geo_gr), node_gr)
+    geo_gr.add_nodes_from(_nodes_from_gdf(n_gdf, node_id, node_attr))
+    return geo_gr
 
 
 def to_geopandas_edgelist(graph, source='source', target='target', nodelist=None):
@@ -168,9 +179,18 @@ def to_geopandas_edgelist(graph, source='source', target='target', nodelist=None
     GeoDataFrame
         Graph edge list.
     """
-    pd_edgelist = nx.to_pandas_edgelist(
-        graph, source=source, target=target, nodelist=nodelist)
-    return gpd.GeoDataFrame(pd_edgelist, crs=graph.graph['crs'])
+    sources, targets, data = [], [], []
+    for src, tgt, dic in graph.edges(nodelist, data=True):
+        sources.append(src)
+        targets.append(tgt)
+        data.append(dic)
+    attrs = dict.fromkeys(key for dic in data for key in dic)
+    if source in attrs or target in attrs:
+        raise nx.NetworkXError(
+            'Source or target column name is already an edge attribute name')
+    edges = {source: sources, target: targets}
+    edges |= {attr: [dic.get(attr, math.nan) for dic in data] for attr in attrs}
+    return gpd.GeoDataFrame(edges, crs=utils.crs_object(graph.graph['crs']))
 
 
 def to_geopandas_nodelist(graph, node_id='node_id', nodelist=None):
@@ -192,14 +212,16 @@ def to_geopandas_nodelist(graph, node_id='node_id', nodelist=None):
     GeoDataFrame
        Graph node list.
     """
-    data = np.array(graph.nodes.data())
-    if not len(data):
+    node_ids = list(nodelist or graph.nodes)
+    if not node_ids:
         return None
-    nodes = pd.DataFrame.from_records(data[:, 1])
-    nodes[node_id] = pd.Series(list(graph.nodes))
-    if nodelist:
-        nodes = nodes.set_index(node_id).loc[nodelist].reset_index()
-    return gpd.GeoDataFrame(nodes, crs=graph.graph['crs'])
+    data = [graph._node[nd] for nd in node_ids]
+    # the columns are the attributes of all the nodes (even with a nodelist)
+    attrs = dict.fromkeys(key for dic in graph._node.values() for key in dic)
+    nodes = {attr: [dic.get(attr, math.nan) for dic in data] for attr in attrs}
+    # node_id is the first column for a nodelist, the last one otherwise
+    nodes = ({node_id: node_ids} | nodes) if nodelist else (nodes | {node_id: node_ids})
+    return gpd.GeoDataFrame(nodes, crs=utils.crs_object(graph.graph['crs']))
 
 
 def project_graph(nodes_src, target, radius, node_attr, edge_attr):
@@ -231,23 +253,24 @@ def project_graph(nodes_src, target, radius, node_attr, edge_attr):
        The GeoGraph is the garph created.
        The GeoDataFrame is the nodes_src with non projected nodes.
     '''
-    
-    target = target[[GEOM, NODE_ID]].copy()
-    target['geom_right'] = target[GEOM]
-    joined = gpd.sjoin_nearest(
-        nodes_src, target, how='left', max_distance=radius, distance_col=WEIGHT)
-    joined = joined[pd.notna(joined[WEIGHT])]
+    if nodes_src.crs != target.crs:
+        raise gnx.geograph.GeoGraphError(
+            "nodes_src and target must both have the same crs.")
+    target = target.reset_index(drop=True)
+    src_geom = nodes_src[GEOM].to_numpy()
+    (idx_src, idx_tgt), dist = target.sindex.nearest(
+        src_geom, max_distance=radius, return_distance=True)
+    joined = nodes_src.iloc[idx_src]
     nodes_src_other = nodes_src[~nodes_src.index.isin(joined.index)]
 
-    gs_nodes = joined[node_attr + [GEOM, 'node_id_left', ]
-                      ].rename(columns={"node_id_left": NODE_ID})
-    gs_edges = joined[['node_id_left', 'node_id_right', WEIGHT, GEOM]]
-    gs_edges = gs_edges.rename(
-        columns={"node_id_left": "source", "node_id_right": "target"})
-    gs_edges[GEOM] = gpd.GeoSeries(gs_edges[GEOM]).shortest_line(
-        gpd.GeoSeries(joined['geom_right']))
-    for key, value in edge_attr.items():
-        gs_edges[key] = value
+    gs_nodes = joined[node_attr + [GEOM, NODE_ID]]
+    gs_edges = gpd.GeoDataFrame({
+        'source': joined[NODE_ID].to_numpy(),
+        'target': target[NODE_ID].to_numpy()[idx_tgt],
+        WEIGHT: dist,
+        GEOM: shapely.shortest_line(src_geom[idx_src], target[GEOM].to_numpy()[idx_tgt])},
+        crs=nodes_src.crs)
+    gs_edges = gs_edges.assign(**edge_attr)
     gs = gnx.from_geopandas_edgelist(
         gs_edges, edge_attr=True, node_gdf=gs_nodes, node_id=NODE_ID, node_attr=node_attr)
     return (gs, nodes_src_other)
@@ -3,14 +3,15 @@
 This module contains the `GeoGraph` class.
 """
 
-import geopandas as gpd
-import folium
+from heapq import heappop, heappush
+from itertools import count
+import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
-from shapely import LineString
+import shapely
+from shapely import LineString, STRtree
 from geo_nx.convert import to_geopandas_edgelist
 from geo_nx.convert import to_geopandas_nodelist
-from geo_nx.utils import geo_cut, cast_id
+from geo_nx.utils import geo_cut, geo_centroid, cast_id
 
 GEOM = 'geometry'
 WEIGHT = 'weight'
@@ -29,7 +30,9 @@ class GeoGraph(nx.Graph):
     *instance methods*
 
     - `insert_node`
+    - `insert_nodes`
     - `project_node`
+    - `project_nodes`
     - `to_geopandas_edgelist`
     - `to_geopandas_nodelist`
     - `plot`
@@ -37,6 +40,7 @@ class GeoGraph(nx.Graph):
     - `find_nearest_edge`
     - `find_nearest_node`
     - `weight_extend`
+    - `weight_extend_batch`
 
     """
 
@@ -75,12 +79,12 @@ class GeoGraph(nx.Graph):
         dist: float
             Distance between add_node and graph (None if distance > radius).
           '''
-        geo_st = self.nodes[add_node][GEOM].centroid
-        id_node = graph.find_nearest_node(geo_st, radius) # recherche d'un noeud à moins de 3 km
+        att_node = self._node[add_node]
+        geo_st = geo_centroid(att_node[GEOM])
+        id_node, dis1 = graph._nearest_node(geo_st, radius) # recherche d'un noeud à moins de 3 km
         if not id_node:
             return None
-        dis1 = geo_st.distance(graph.nodes[id_node][GEOM])
-        graph.add_node(id_node, **self.nodes[add_node])
+        graph.add_nodes_from([(id_node, att_node)])
         return dis1
 
     def project_node(self, add_node, graph, radius, att_edge=None, update_node=False, 
@@ -115,18 +119,71 @@ class GeoGraph(nx.Graph):
             Distance between add_node and graph (None if distance > radius).
           '''
         att_edge = {} if not att_edge else att_edge
-        geo_st = self.nodes[add_node][GEOM].centroid
-        id_node = target_node if target_node else graph.find_nearest_node(geo_st, radius)
-        if not id_node:
-            return None
-        dis1 = geo_st.distance(graph.nodes[id_node][GEOM])
+        att_node = self._node[add_node]
+        geo_st = geo_centroid(att_node[GEOM])
+        if target_node:
+            id_node = target_node
+            geo_node = graph._node[id_node][GEOM]
+            dis1 = geo_st.distance(geo_node)
+        else:
+            id_node, dis1 = graph._nearest_node(geo_st, radius)
+            if not id_node:
+                return None
+            geo_node = graph._node[id_node][GEOM]
         if update_node:
-            graph.add_node(id_node, **(self.nodes[add_node] | {GEOM:graph.nodes[id_node][GEOM]}))
+            graph.add_nodes_from([(id_node, att_node | {GEOM: geo_node})])
         else:
-            geo1 = LineString([graph.nodes[id_node][GEOM], geo_st])
-            self.add_edge(id_node, add_node, **(att_edge | {GEOM:geo1, WEIGHT: dis1})) 
+            geo1 = LineString([geo_node, geo_st])
+            self.add_edges_from([(id_node, add_node, att_edge | {GEOM: geo1, WEIGHT: dis1})])
         return dis1
 
+    def project_nodes(self, add_nodes, graph, radius, att_edge=None, update_node=False):
+        '''Add a list of external nodes in a Graph (see `project_node`).
+
+        The nearest nodes of 'graph' are found with a single query of the spatial index.
+
+        Parameters
+        ----------
+
+        add_nodes: iterable of id
+            Id of the nodes to project.
+        graph: GeoGraph
+            Graph to connect to the add_nodes.
+        radius: float
+            Maximum distance between add_node and graph.
+        att_edge: dict
+            Attributes of the added edges.
+        update_node: boolean
+            If True, the nearest nodes are updated with 'add_nodes' attributes.
+            If False, LineString edges are added.
+
+        Returns
+        -------
+
+        dict
+            Distance between each add_node and graph (None if distance > radius).
+          '''
+        att_edge = {} if not att_edge else att_edge
+        add_nodes = list(add_nodes)
+        dists = dict.fromkeys(add_nodes)
+        geo_sts = [geo_centroid(self._node[add_node][GEOM]) for add_node in add_nodes]
+        tree, node_ids = graph._spatial_index('nodes')
+        (idx_add, idx_gr), dist = tree.query_nearest(geo_sts, max_distance=radius,
+                                                     return_distance=True, all_matches=False)
+        add_ids = [add_nodes[idx] for idx in idx_add]
+        gr_ids = [node_ids[idx] for idx in idx_gr]
+        gr_geoms = tree.geometries.take(idx_gr)
+        dists |= zip(add_ids, dist.tolist())
+        if update_node:
+            graph.add_nodes_from((id_node, self._node[add_node] | {GEOM: geom})
+                                 for add_node, id_node, geom in zip(add_ids, gr_ids, gr_geoms))
+        else:
+            lines = shapely.shortest_line(gr_geoms, [geo_sts[idx] for idx in idx_add])
+            self.add_edges_from((id_node, add_node, att_edge | {GEOM: line, WEIGHT: dis})
+                                for add_node, id_node, line, dis in
+                                zip(add_ids, gr_ids, lines, dist.tolist()))
+        return dists
+
     def erase_node(self, id_node, adjust=False):
         "to be define"
         return
@@ -162,25 +219,111 @@ class GeoGraph(nx.Graph):
 
         This method is available only with LineString as edge geometry.
         """
-        att_edge = self.edges[*id_edge]
+        cut = self._cut_edge(geom, id_node, id_edge, self._adj[id_edge[0]][id_edge[1]],
+                             self._node[id_edge[0]][GEOM], att_node, adjust)
+        if not cut:
+            return None
+        node, edges, dist = cut
+        self.add_nodes_from([node])
+        self.add_edges_from(edges)
+        self.remove_edge(*id_edge)
+        return dist
+
+    def insert_nodes(self, geoms, id_nodes, id_edges=None, att_nodes=None, adjust=False,
+                     max_distance=None):
+        """Cut a list of edges and insert the new nodes (see `insert_node`).
+
+        The nodes and edges are added (and the cut edges removed) in a single
+        operation for all the nodes. When several nodes are inserted in the same
+        edge, they are inserted in the order of their projection on the edge line.
+        If the edges are not defined, the nearest edges are found with a single
+        query of the spatial index.
+
+        Parameters
+        ----------
+
+        geoms: iterable of shapely geometry
+            Geometries to be projected on the edges lines (centroid projection).
+        id_nodes: iterable of id
+            Id of the inserted nodes.
+        id_edges: iterable of tuple of two id_node (default None)
+            Id of the cuted edges. If None, the nearest edges are used.
+        att_nodes: iterable of dict (default None)
+            Attributes of the inserted nodes.
+        adjust: boolean
+            If True, the new points are the geometries centroid else the projected lines points
+        max_distance: float (default None)
+            Maximum distance between a geometry and its nearest edge (used if id_edges is None).
+
+        Returns
+        -------
+
+        dict
+            Abcissa of each new node in the cuted edge geometry (None if the node is not inserted).
+        """
+        geoms = list(geoms)
+        id_nodes = list(id_nodes)
+        att_nodes = list(att_nodes) if att_nodes else [None] * len(id_nodes)
+        if id_edges is None:
+            tree, edge_ids = self._spatial_index('edges')
+            inds, idx_edge = tree.query_nearest(shapely.centroid(geoms), max_distance=max_distance,
+                                                all_matches=False)
+            id_edges = dict(zip(inds.tolist(), (edge_ids[idx] for idx in idx_edge)))
+        else:
+            id_edges = dict(enumerate(tuple(id_edge) for id_edge in id_edges))
+        groups = {}
+        for ind, id_edge in id_edges.items():
+            groups.setdefault(frozenset(id_edge), []).append(ind)
+        dists = dict.fromkeys(id_nodes)
+        nodes, edges, cut_edges = [], [], []
+        for inds in groups.values():
+            id_edge = id_edges[inds[0]]
+            att_edge = self._adj[id_edge[0]][id_edge[1]]
+            geo_start = self._node[id_edge[0]][GEOM]
+            if len(inds) > 1:
+                abscs = shapely.line_locate_point(att_edge[GEOM],
+                                                  shapely.centroid([geoms[ind] for ind in inds]))
+                inds = [inds[ind] for ind in np.argsort(abscs, kind='stable')]
+            remainder = None
+            for ind in inds:
+                cut = self._cut_edge(geoms[ind], id_nodes[ind], id_edge, att_edge, geo_start,
+                                     att_nodes[ind], adjust)
+                if not cut:
+                    continue
+                if not remainder:
+                    cut_edges.append(id_edge)
+                node, (edge1, remainder), dists[id_nodes[ind]] = cut
+                nodes.append(node)
+                edges.append(edge1)
+                # the next nodes are inserted in the second part of the edge
+                id_edge, att_edge, geo_start = remainder[:2], remainder[2], node[1][GEOM]
+            if remainder:
+                edges.append(remainder)
+        self.add_nodes_from(nodes)
+        self.add_edges_from(edges)
+        self.remove_edges_from(cut_edges)
+        return dists
+
+    def _cut_edge(self, geom, id_node, id_edge, att_edge, geo_start, att_node, adjust):
+        '''Return the new node, the two new edges (with attributes) and the abcissa
+        of the new node for the cut of an edge defined by its attributes and
+        the geometry of its first node (None if the geometry is projected on an
+        end of the edge - see `insert_node`).
+
+        The second new edge follows the first one in the edge line.'''
         att_node = att_node if att_node else {}
         new_geo = geo_cut(att_edge[GEOM], geom, adjust=adjust)
         if not new_geo:
             return None
         geo1, geo2, intersect, dist = new_geo
 
-        edg_0 = self.nodes[id_edge[0]][GEOM].coords[0]
-        first = id_edge[0] if edg_0 == geo1.coords[0] else id_edge[1]
+        first = id_edge[0] if (geo_start.x, geo_start.y) == geo1.coords[0][:2] else id_edge[1]
         last = id_edge[1] if first == id_edge[0] else id_edge[0]
 
-        self.add_node(id_node, **(att_node | {GEOM: intersect}))
-        self.add_edge(first, id_node, **(att_edge |
-                      {GEOM: geo1, WEIGHT: geo1.length}))
-        self.add_edge(id_node, last, **(att_edge |
-                      {GEOM: geo2, WEIGHT: geo2.length}))
-        self.remove_edge(*id_edge)
-
-        return dist
+        return ((id_node, att_node | {GEOM: intersect}),
+                [(first, id_node, att_edge | {GEOM: geo1, WEIGHT: geo1.length}),
+                 (id_node, last, att_edge | {GEOM: geo2, WEIGHT: geo2.length})],
+                dist)
 
     def to_geopandas_edgelist(self, source='source', target='target', nodelist=None):
         """see `convert.to_geopandas_edgelist`"""
@@ -210,13 +353,9 @@ class GeoGraph(nx.Graph):
         '''
         param = {'e_edgecolor': 'black',
                  'n_marker': 'o', 'n_color': 'red', 'n_markersize': 5} | param
-        common_param = dict((k, v) for k, v in param.items()
-                            if k[:2] not in ['e_', 'n_'] and v)
-        edge_param = common_param | dict(
-            (k[2:], v) for k, v in param.items() if k[:2] == 'e_' and v)
-        node_param = common_param | dict(
-            (k[2:], v) for k, v in param.items() if k[:2] == 'n_' and v)
+        edge_param, node_param = _split_param(param)
 
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots()
         if edges:
             self.to_geopandas_edgelist().plot(ax=ax, **edge_param)
@@ -253,22 +392,18 @@ class GeoGraph(nx.Graph):
                  'e_tooltip': None, 'n_tooltip': None,
                  'e_color': 'blue', 'n_color': 'black',
                  'n_marker_kwds': {'radius': 2, 'fill': True}} | param
-        common_param = dict((k, v) for k, v in param.items()
-                            if k[:2] not in ['e_', 'n_'] and v)
-        edge_param = common_param | dict(
-            (k[2:], v) for k, v in param.items() if k[:2] == 'e_' and v)
-        node_param = common_param | dict(
-            (k[2:], v) for k, v in param.items() if k[:2] == 'n_' and v)
+        edge_param, node_param = _split_param(param)
 
+        import folium
         if isinstance(refmap, dict):
             refmap = folium.Map(**refmap)
         elif refmap is None:
             refmap = folium.Map()
 
-        if edges and self.edges:
+        if edges and any(self._adj.values()):
             self.to_geopandas_edgelist(
                 nodelist=nodelist).explore(m=refmap, **edge_param)
-        if nodes and self.nodes:
+        if nodes and self._node:
             self.to_geopandas_nodelist(
                 nodelist=nodelist).explore(m=refmap, **node_param)
         if layercontrol:
@@ -278,7 +413,11 @@ class GeoGraph(nx.Graph):
     def find_nearest_edge(self, geom, max_distance):
         '''Find the closest edge to a geometry
 
-        Spatial join based on the distance between given geometry and edges geometries.
+        Query of a spatial index (STRtree) of the edges geometries with the
+        centroid of the given geometry. The spatial index is built at the first
+        query and kept until edges are added or removed. An in-place change of a
+        geometry attribute (eg. `graph.nodes[n]['geometry'] = ...`) is not detected:
+        the index has to be reset with `graph.__networkx_cache__.clear()`.
 
         Results will include a single output records (even in case of multiple
         nearest and equidistant geometries).
@@ -286,7 +425,7 @@ class GeoGraph(nx.Graph):
         Parameters
         ----------
         geom : Shapely Geometry
-            Geometry used in the spatial join.
+            Geometry used in the spatial query.
         max_distance : float
             Maximum distance within which to query for nearest geometry.
 
@@ -295,20 +434,22 @@ class GeoGraph(nx.Graph):
         list
             id of the nearest edge (list of two id_node)
         '''
-        gdf_pt = gpd.GeoDataFrame(
-            {GEOM: [geom.centroid]}, crs=self.graph['crs'])
-        gdf_ed = self.to_geopandas_edgelist()
-        troncons = gdf_pt.sjoin_nearest(
-            gdf_ed, max_distance=max_distance, distance_col=WEIGHT)
-        if len(troncons):
-            troncon = troncons.sort_values(by=WEIGHT).iloc[0]
-            return [cast_id(troncon['source']), cast_id(troncon['target'])]
+        tree, edge_ids = self._spatial_index('edges')
+        idx, dist = tree.query_nearest(geo_centroid(geom), max_distance=max_distance,
+                                       return_distance=True)
+        if len(idx):
+            source, target = edge_ids[idx[dist.argmin()]]
+            return [cast_id(source), cast_id(target)]
         return None
 
     def find_nearest_node(self, geom, max_distance):
         '''Find the closest node to a geometry.
 
-        Spatial join based on the distance between given geometry and nodes geometries.
+        Query of a spatial index (STRtree) of the nodes geometries with the
+        centroid of the given geometry. The spatial index is built at the first
+        query and kept until nodes are added or removed. An in-place change of a
+        geometry attribute (eg. `graph.nodes[n]['geometry'] = ...`) is not detected:
+        the index has to be reset with `graph.__networkx_cache__.clear()`.
 
         Results will include a single output records (even in case of multiple
         nearest and equidistant geometries).
@@ -316,26 +457,55 @@ class GeoGraph(nx.Graph):
         Parameters
         ----------
         geom : Shapely Geometry
-            Geometry used in the spatial join.
+            Geometry used in the spatial query.
         max_distance : float
             Maximum distance within which to query for nearest geometry.
 
         Returns
         -------
-        list
-            id of the nearest edge (list of two id_node)
+        int or str
+            id of the nearest node
         '''
-        gdf_pt = gpd.GeoDataFrame(
-            {GEOM: [geom.centroid]}, crs=self.graph['crs'])
-        gdf_no = self.to_geopandas_nodelist()
-        noeuds = gdf_pt.sjoin_nearest(
-            gdf_no, max_distance=max_distance, distance_col=WEIGHT)
-        if len(noeuds):
-            noeud = noeuds.sort_values(by=WEIGHT).iloc[0]
-            return cast_id(noeud[NODE_ID])
-        return None
-
-    def weight_extend(self, edge, ext_gr, radius=None, n_attribute=None, n_active=None):
+        return self._nearest_node(geom, max_distance)[0]
+
+    def _nearest_node(self, geom, max_distance):
+        '''Return the id of the closest node to a geometry and its distance
+        ((None, None) if no node is found - see `find_nearest_node`).'''
+        tree, node_ids = self._spatial_index('nodes')
+        idx, dist = tree.query_nearest(geo_centroid(geom), max_distance=max_distance,
+                                       return_distance=True)
+        if len(idx):
+            i_min = dist.argmin()
+            return cast_id(node_ids[idx[i_min]]), float(dist[i_min])
+        return None, None
+
+    def _spatial_index(self, element):
+        '''Return the STRtree of the 'nodes' or 'edges' geometries and the related ids.
+
+        The STRtree is stored in the networkx cache of the graph. This cache is
+        cleared by every change of nodes or edges (after an in-place change of a
+        geometry attribute, the cache has to be cleared with
+        `graph.__networkx_cache__.clear()`). Graph views (eg. subgraph) are not
+        cached because their cache is not cleared by the changes of the graph.'''
+        is_view = hasattr(self, '_graph')
+        cache = None if is_view else getattr(self, '__networkx_cache__', None)
+        key = 'geo_nx_' + element
+        if cache is not None and key in cache:
+            return cache[key]
+        if element == 'nodes':
+            ids = list(self._node)
+            geoms = [dic.get(GEOM) for dic in self._node.values()]
+        else:
+            edges = list(self.edges(data=GEOM))
+            ids = [(source, target) for source, target, _ in edges]
+            geoms = [geom for _, _, geom in edges]
+        index = (STRtree(geoms), ids)
+        if cache is not None:
+            cache[key] = index
+        return index
+
+    def weight_extend(self, edge, ext_gr, radius=None, n_attribute=None, n_active=None,
+                      budget=None):
         '''Find the path (witch contains edge) between nodes included in 
         a projected graph and with minimal weight.
 
@@ -352,24 +522,92 @@ class GeoGraph(nx.Graph):
             Node attribute to store node projected distance.
         n_active : str (default None)
             Node attribute that indicates the validity (boolean) of the node.
+        budget : float (default None)
+            Maximal extended weight. If the extended weight is greater, None is
+            returned (the search of the nearest external nodes is limited to this value).
         Returns
         -------
         float
             extended weight
         '''
-        dist_ext = self.edges[edge][WEIGHT]
+        dist_ext = self._adj[edge[0]][edge[1]][WEIGHT]
         radius = max(dist_ext, radius) if radius else dist_ext
-        for node in edge:
-            if n_attribute in self.nodes[node] and self.nodes[node][n_attribute]:
-                dist_st = self.nodes[node][n_attribute]
-            else:
-                dist_st = self.weight_node_to_graph(node, ext_gr, radius=radius,
+        # nodes with a stored distance first (no Dijkstra needed)
+        for node in sorted(edge, key=lambda nd: n_attribute not in self._node[nd]):
+            node_radius = radius
+            if budget is not None:
+                if dist_ext >= budget:
+                    return None
+                node_radius = min(radius, budget - dist_ext)
+            dist_st = self._node[node].get(n_attribute) if n_attribute else None
+            if not dist_st:
+                dist_st = self.weight_node_to_graph(node, ext_gr, radius=node_radius,
                                                     attribute=n_attribute, active=n_active)
             if not dist_st:
                 return None
             dist_ext += dist_st
+        if budget is not None and dist_ext > budget:
+            return None
         return dist_ext
 
+    def weight_extend_batch(self, edges, ext_gr, radius=None, n_attribute=None, n_active=None):
+        '''Apply `weight_extend` to a list of edges.
+
+        The distances to the projected graph are calculated with a single
+        multi-source Dijkstra search from the projected nodes (instead of one
+        search per edge node).
+
+        Parameters
+        ----------
+        edges : iterable of tuple
+            Edges to extend in the projected graph.
+        ext_gr : Graph
+            Projected Graph.
+        radius : float (default None)
+            radius used to find the nearest external node for each node of the edge.
+            If None, the radius used is the weight of the edge.
+        n_attribute : str (default None)
+            Node attribute to store node projected distance.
+        n_active : str (default None)
+            Node attribute that indicates the validity (boolean) of the node.
+        Returns
+        -------
+        dict
+            extended weight (or None) for each edge
+        '''
+        edges = list(edges)
+        node_att = self._node
+        edge_radius = {}
+        for edge in edges:
+            dist_ext = self._adj[edge[0]][edge[1]][WEIGHT]
+            edge_radius[edge] = max(dist_ext, radius) if radius else dist_ext
+        sources = {nd for nd in ext_gr if nd in node_att and node_att[nd].get(n_active, True)}
+        lengths = {}
+        if sources and edges:
+            lengths = nx.multi_source_dijkstra_path_length(
+                self, sources, cutoff=max(edge_radius.values()), weight=WEIGHT)
+        weights = {}
+        for edge in edges:
+            dist_ext = self._adj[edge[0]][edge[1]][WEIGHT]
+            e_radius = edge_radius[edge]
+            for node in sorted(edge, key=lambda nd: n_attribute not in node_att[nd]):
+                dist_st = node_att[node].get(n_attribute) if n_attribute else None
+                if not dist_st and node in sources:
+                    # the nearest projected node is another one
+                    dist_st = self.weight_node_to_graph(node, ext_gr, radius=e_radius,
+                                                        attribute=n_attribute, active=n_active)
+                elif not dist_st:
+                    dist_st = lengths.get(node)
+                    dist_st = dist_st if dist_st is not None and dist_st <= e_radius else None
+                    if dist_st and n_attribute:
+                        node_att[node][n_attribute] = dist_st
+                if not dist_st:
+                    dist_ext = None
+                    break
+                dist_ext += dist_st
+            weights[edge] = dist_ext
+        return weights
+
     def weight_node_to_graph(self, node, ext_gr, radius=None, attribute=None, active=None):
         '''Return the distance between a node and a projected graph.
 
@@ -392,17 +630,59 @@ class GeoGraph(nx.Graph):
             distance between the node and the projected graph
         '''
         if radius:
-            ego_gr = nx.ego_graph(self, node, radius=radius, distance=WEIGHT).nodes
-            near_gr = [nd for nd in ego_gr if nd in ext_gr and nd != node and
-                       (active not in self.nodes[nd] or self.nodes[nd][active])]
+            node_att = self._node
+            dist = self._nearest_length(node, lambda nd: nd != node and nd in ext_gr and
+                                        node_att[nd].get(active, True), cutoff=radius)
         else:
-            near_gr = ext_gr
-        dist_st = [nx.shortest_path_length(self, source=node, target=nd, weight=WEIGHT)
-                   for nd in near_gr]
-        dist = None if not dist_st else min(dist_st)
+            dist = self._nearest_length(node, lambda nd: nd in ext_gr)
         if dist and attribute:
-            self.nodes[node][attribute] = dist
+            self._node[node][attribute] = dist
         return  dist
 
+    def _nearest_length(self, source, is_target, cutoff=None):
+        '''Return the weighted length of the shortest path between source and
+        the nearest node validating is_target (None if no node is found).
+
+        The Dijkstra search stops at the first target reached or when the length
+        exceeds cutoff.'''
+        adj = self._adj
+        done = set()
+        seen = {source: 0}
+        counter = count()
+        heap = [(0, next(counter), source)]
+        while heap:
+            dist, _, node = heappop(heap)
+            if node in done:
+                continue
+            if is_target(node):
+                return dist
+            done.add(node)
+            for nbr, att_edge in adj[node].items():
+                dist_nbr = dist + att_edge.get(WEIGHT, 1)
+                if cutoff is not None and dist_nbr > cutoff:
+                    continue
+                if nbr not in seen or dist_nbr < seen[nbr]:
+                    seen[nbr] = dist_nbr
+                    heappush(heap, (dist_nbr, next(counter), nbr))
+        return None
+
+
+def _split_param(param):
+    '''Return the edge parameters and the node parameters (common parameters
+    and parameters preceded by *e_* or *n_*) of a plot parameters dict.'''
+    common_param, edge_param, node_param = {}, {}, {}
+    for key, value in param.items():
+        if not value:
+            continue
+        match key[:2]:
+            case 'e_':
+                edge_param[key[2:]] = value
+            case 'n_':
+                node_param[key[2:]] = value
+            case _:
+                common_param[key] = value
+    return common_param | edge_param, common_param | node_param
+
+
 class GeoGraphError(Exception):
     """GeoGraph Exception"""
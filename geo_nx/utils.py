@@ -2,7 +2,11 @@
 """
 Functions used for geometry analysis
 """
+from functools import lru_cache
+import numpy as np
+import shapely
 from shapely import LineString, Point
+from pyproj import CRS
 import pandas as pd
 import geopandas as gpd
 
@@ -75,6 +79,23 @@ def geo_merge(geo1, geo2, adjust=True):
         case _:
             return None
 
+
+def geo_centroid(geom):
+    '''Return the centroid of a geometry (the geometry itself for a Point).
+
+    Parameters
+    ----------
+    geom : shapely geometry
+        Geometry to convert.
+
+    Returns
+    -------
+    shapely Point
+        Centroid of the geometry.
+    '''
+    return geom if isinstance(geom, Point) else geom.centroid
+
+
 def geo_cut(line, geom, adjust=False):
     '''Cuts a line in two at the geometry nearest projection point
 
@@ -97,23 +118,23 @@ def geo_cut(line, geom, adjust=False):
         - line coordinate for intersected point (float)
     '''
     line = LineString(line)
-    point = geom.centroid
+    point = geo_centroid(geom)
     absc = line.project(point)
     if absc <= 0.0 or absc >= line.length:
         return None
     coords = list(line.coords)
-    for ind, coord in enumerate(coords):
-        pt_absc = line.project(Point(coord))
-        if pt_absc == absc:
-            coords[ind] = point.coords[0] if adjust else coords[ind]
-            return [LineString(coords[:ind+1]), LineString(coords[ind:]), Point(coords[ind]), 0.0]
-        if pt_absc > absc:
-            cp = line.interpolate(absc)
-            new_c = point.coords[0] if adjust else (cp.x, cp.y)
-            dist = 0.0 if adjust else point.distance(Point(new_c))
-            return [LineString(coords[:ind] + [new_c]),
-                    LineString([new_c] + coords[ind:]), Point(new_c), dist]
-    return None
+    # line coordinate of the vertices (cumulated length of the segments)
+    delta = np.diff(shapely.get_coordinates(line), axis=0)
+    vertex_absc = np.concatenate(([0.0], np.cumsum(np.sqrt(np.sum(delta * delta, axis=1)))))
+    ind = int(np.searchsorted(vertex_absc, absc))
+    if vertex_absc[ind] == absc:
+        coords[ind] = point.coords[0] if adjust else coords[ind]
+        return [LineString(coords[:ind+1]), LineString(coords[ind:]), Point(coords[ind]), 0.0]
+    cp = line.interpolate(absc)
+    new_c = point.coords[0] if adjust else (cp.x, cp.y)
+    dist = 0.0 if adjust else point.distance(Point(new_c))
+    return [LineString(coords[:ind] + [new_c]),
+            LineString([new_c] + coords[ind:]), Point(new_c), dist]
 
 
 def nodes_gdf_from_edges_gdf(e_gdf, source=None, target=None):
@@ -137,28 +158,49 @@ def nodes_gdf_from_edges_gdf(e_gdf, source=None, target=None):
        n_gdf: Tabular representation of nodes (created),
        e_gdf: Tabular representation of nodes (addition of source and target columns),
     """
-    crs = e_gdf.crs.to_epsg()
+    crs = e_gdf.crs
     node_id = 'node_id'
-    e_gdf["source_geo"] = e_gdf[GEOM].apply(lambda ls: ls.boundary.geoms[0])
-    e_gdf["target_geo"] = e_gdf[GEOM].apply(lambda ls: ls.boundary.geoms[1])
+
+    geoms = e_gdf[GEOM].to_numpy()
+    coords, starts, ends = _line_ends(geoms)
 
     if source in e_gdf.columns:
+        e_gdf = e_gdf.assign(
+            source_geo=gpd.GeoSeries(shapely.points(coords[starts]), index=e_gdf.index, crs=crs),
+            target_geo=gpd.GeoSeries(shapely.points(coords[ends]), index=e_gdf.index, crs=crs))
         e_gdf_source = e_gdf.loc[:, [source, "source_geo"]].rename(
             columns={source: node_id, "source_geo": GEOM})
         e_gdf_target = e_gdf.loc[:, [target, "target_geo"]].rename(
             columns={target: node_id, "target_geo": GEOM})
         n_gdf = pd.concat([e_gdf_source, e_gdf_target]).drop_duplicates()
-    else:
-        n_gdf = pd.concat([e_gdf["source_geo"], e_gdf["target_geo"]]
-                          ).drop_duplicates().reset_index(drop=True)
-        nodidx = pd.Series(n_gdf.index, index=n_gdf)
-        e_gdf = e_gdf.join(nodidx.rename(source), on="source_geo", how='left')
-        e_gdf = e_gdf.join(nodidx.rename(target), on="target_geo", how='left')
-        n_gdf = gpd.GeoDataFrame({GEOM: n_gdf, node_id: n_gdf.index}, crs=crs)
-    del e_gdf["source_geo"], e_gdf["target_geo"]
+        del e_gdf["source_geo"], e_gdf["target_geo"]
+        return (n_gdf, e_gdf)
+
+    # ends of the lines: sources then targets, numbered in order of first appearance
+    unique, first, inverse = np.unique(coords[np.concatenate([starts, ends])], axis=0,
+                                       return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    ids = rank[inverse.ravel()]
+    e_gdf = e_gdf.assign(**{source: ids[:len(geoms)], target: ids[len(geoms):]})
+    n_gdf = gpd.GeoDataFrame({GEOM: shapely.points(unique[order]), node_id: np.arange(len(order))},
+                             crs=crs)
     return (n_gdf, e_gdf)
 
 
+def _line_ends(geoms):
+    '''Return the coordinates of the geometries and, for each geometry, the index
+    of its first and last coordinate (the ends of a LineString or MultiLineString).'''
+    if not (shapely.get_num_coordinates(geoms) > 0).all():
+        raise ValueError("edge geometries must not be None or empty")
+    coords, index = shapely.get_coordinates(geoms, include_z=shapely.has_z(geoms).any(),
+                                            return_index=True)
+    lines = np.arange(len(geoms))
+    return (coords, np.searchsorted(index, lines),
+            np.searchsorted(index, lines, side='right') - 1)
+
+
 def add_geometry_edges_from_nodes(e_gdf, source, target, n_gdf, node_id):
     """add a geometry column in an edges GeoDataFrame from geometry nodes.
 
@@ -179,19 +221,12 @@ def add_geometry_edges_from_nodes(e_gdf, source, target, n_gdf, node_id):
     GeoDataFrame
        Graph edge with additional 'geometry' column.
     """
-    crs = n_gdf.crs.to_epsg()
-    e_gdf = pd.merge(e_gdf, n_gdf.loc[:, (node_id, GEOM)], how='left', left_on=source,
-                     right_on=node_id).rename(columns={GEOM: 'geom_source'})
-    e_gdf.pop(node_id)
-    e_gdf = pd.merge(e_gdf, n_gdf.loc[:, (node_id, GEOM)], how='left', left_on=target,
-                     right_on=node_id).rename(columns={GEOM: 'geom_target'})
-    e_gdf.pop(node_id)
-    gs_src = gpd.GeoSeries(e_gdf['geom_source'])
-    gs_tgt = gpd.GeoSeries(e_gdf['geom_target'])
-    e_gdf = gpd.GeoDataFrame(
-        e_gdf, geometry=gs_src.shortest_line(gs_tgt), crs=crs)
-    del e_gdf["geom_source"], e_gdf["geom_target"]
-    return e_gdf
+    crs = n_gdf.crs
+    ids = pd.Index(n_gdf[node_id])
+    geoms = n_gdf[GEOM].array
+    geo_src = np.asarray(geoms.take(ids.get_indexer(e_gdf[source]), allow_fill=True))
+    geo_tgt = np.asarray(geoms.take(ids.get_indexer(e_gdf[target]), allow_fill=True))
+    return gpd.GeoDataFrame(e_gdf, geometry=shapely.shortest_line(geo_src, geo_tgt), crs=crs)
 
 
 def geom_to_crs(geom, crs, new_crs):
@@ -214,6 +249,33 @@ def geom_to_crs(geom, crs, new_crs):
     return gpd.GeoSeries([geom], crs=crs).to_crs(new_crs)[0]
 
 
+def crs_object(crs):
+    '''return the pyproj CRS defined by a crs value (eg. EPSG code).
+
+    CRS built from an EPSG code or a string are cached.
+
+    Parameters
+    ----------
+    crs : pyproj CRS, int, str or None
+        Value accepted by `pyproj.CRS.from_user_input`.
+
+    Returns
+    -------
+    pyproj CRS
+       CRS object (None if crs is None).
+    '''
+    if crs is None or isinstance(crs, CRS):
+        return crs
+    if isinstance(crs, (int, str)):
+        return _crs_from_input(crs)
+    return CRS.from_user_input(crs)
+
+
+@lru_cache(maxsize=32)
+def _crs_from_input(crs):
+    return CRS.from_user_input(crs)
+
+
 def cast_id(node_id, only_int=False):
     '''replace number string as integer in a single or an iterable.
 
@@ -231,6 +293,8 @@ def cast_id(node_id, only_int=False):
     List
        list of int (if only_int) or list of int/string.
     '''
+    if type(node_id) is int:
+        return node_id
     if hasattr(node_id, '__iter__') and not isinstance(node_id, str):
         cast_list = list(cast_id(n_id, only_int=only_int) for n_id in node_id)
         return [val for val in cast_list if val is not None]
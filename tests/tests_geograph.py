@@ -4,7 +4,7 @@ Test geo_nx
 """
 import unittest
 
-from shapely import LineString, Point
+from shapely import LineString, MultiLineString, Point
 import geopandas as gpd
 import geo_nx as gnx 
 import networkx as nx 
@@ -16,22 +16,152 @@ paris = Point(2.3514, 48.8575)
 lyon = Point(4.8357, 45.7640)
 marseille = Point(5.3691, 43.3026)
 bordeaux = Point(-0.56667, 44.833328)
+simplemap = gpd.GeoDataFrame({'geometry': [LineString([paris, lyon]), LineString([lyon, marseille]),
+    LineString([paris, bordeaux]), LineString([bordeaux, marseille])]}, crs=4326).to_crs(2154)
+
+l1 = LineString([(0,0), (1,1), (2,2)])
+l1r = LineString([(2,2), (1,1), (0,0)])
+l1s = LineString([(3,3), (4,4), (5,5)])
+l1jr = LineString([(0,0), (6,6)])
+l1j = LineString([(-1,-1), (0,0)])
+l1c = LineString([(0, 2), (2, 0)])
+pt1 = Point((1.5, 1.5))
+pt1e = Point((1.5, 2.5))
 
 class TestGeoGraph(unittest.TestCase):
     """tests GeoGraph class"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.gr_simplemap = gnx.from_geopandas_edgelist(simplemap)
+
     def test_geograph(self):
         """tests GeoGraph"""
-        simplemap = gpd.GeoDataFrame({'geometry': [LineString([paris, lyon]), LineString([lyon, marseille]), 
-            LineString([paris, bordeaux]), LineString([bordeaux, marseille])]}, crs=4326).to_crs(2154)
         gr_simplemap = gnx.from_geopandas_edgelist(simplemap)
-        self.assertTrue(len(gr_simplemap.nodes) == len(gr_simplemap.nodes) == len(simplemap))
-        gr_simplemap.nodes[0]['city'] = 'paris'
-        gr_simplemap.nodes[1]['ville'] = 'lyon'
+        self.assertEqual(len(gr_simplemap.nodes), len(simplemap))
+        nx.set_node_attributes(gr_simplemap, {0: {'city': 'paris'}, 1: {'ville': 'lyon'}})
         simple_edge = gr_simplemap.to_geopandas_edgelist()
         simple_node = gr_simplemap.to_geopandas_nodelist()
         gr_simplemap2 = gnx.from_geopandas_edgelist(simple_edge, node_attr=True, node_gdf=simple_node, node_id='node_id')
         self.assertTrue(graphs_equal(gr_simplemap, gr_simplemap2))
+        self.assertEqual(list(simple_node.columns), ['geometry', 'city', 'ville', 'node_id'])
+        for nodelist in ([2, 1], (nd for nd in [2, 1]), gr_simplemap.nbunch_iter([2, 1])):
+            with self.subTest(nodelist=nodelist):
+                sub_node = gr_simplemap.to_geopandas_nodelist(nodelist=nodelist)
+                self.assertEqual(list(sub_node.columns), ['node_id', 'geometry', 'city', 'ville'])
+                self.assertEqual(list(sub_node.node_id), [2, 1])
+
+    def test_find_nearest(self):
+        """tests find_nearest_node and find_nearest_edge methods"""
+        gr_simplemap = self.gr_simplemap.copy()
+        paris_l93 = gr_simplemap.nodes[0]['geometry']
+        self.assertEqual(gr_simplemap.find_nearest_node(paris_l93, 1000), 0)
+        middle = gr_simplemap.edges[0, 1]['geometry'].interpolate(0.5, normalized=True)
+        self.assertEqual(sorted(gr_simplemap.find_nearest_edge(middle, 1000)), [0, 1])
+        self.assertIsNone(gr_simplemap.find_nearest_node(Point(0, 0), 1000))
+        gr_simplemap.add_node(4, geometry=paris_l93)
+        gr_simplemap.remove_node(0)
+        self.assertEqual(gr_simplemap.find_nearest_node(paris_l93, 1000), 4)
+        self.assertIsNone(gr_simplemap.find_nearest_edge(middle, 1000))
+        gr_simplemap.nodes[4]['geometry'] = middle
+        self.assertEqual(gr_simplemap.find_nearest_node(paris_l93, 1000), 4)
+        gr_simplemap.__networkx_cache__.clear()
+        self.assertIsNone(gr_simplemap.find_nearest_node(paris_l93, 1000))
+        self.assertEqual(gr_simplemap.find_nearest_node(middle, 1000), 4)
+
+    def test_project_nodes(self):
+        """tests project_nodes method"""
+        gr_simplemap = self.gr_simplemap
+        stations = gpd.GeoDataFrame({'geometry': [Point(2.35, 48.85), Point(4.84, 45.76), Point(0, 0)],
+                                     'node_id': ['st0', 'st1', 'st2']}, crs=4326).to_crs(2154)
+        gr_stations = gnx.from_geopandas_nodelist(stations, node_id='node_id')
+        dists = gr_stations.project_nodes(list(gr_stations.nodes), gr_simplemap, 5000,
+                                          att_edge={'type': 'st'})
+        self.assertIsNone(dists['st2'])
+        self.assertTrue(0 < dists['st0'] < 5000 and 0 < dists['st1'] < 5000)
+        self.assertEqual(len(gr_stations.edges), 2)
+        self.assertTrue(gr_stations.has_edge(0, 'st0') and gr_stations.has_edge(1, 'st1'))
+        self.assertEqual(gr_stations.edges[0, 'st0']['type'], 'st')
+        self.assertEqual(gr_stations.edges[0, 'st0']['weight'], dists['st0'])
+
+    def test_project_graph(self):
+        """tests project_graph function"""
+        nodes = self.gr_simplemap.to_geopandas_nodelist()
+        stations = gpd.GeoDataFrame({'geometry': [Point(2.35, 48.85)], 'node_id': ['st0']},
+                                    crs=4326)
+        with self.assertRaises(gnx.geograph.GeoGraphError):
+            gnx.project_graph(stations, nodes, 5000, [], {})
+        gr_st, other = gnx.project_graph(stations.to_crs(2154), nodes, 5000, [], {'type': 'st'})
+        self.assertTrue(gr_st.has_edge('st0', 0) and other.empty)
+        self.assertTrue(0 < gr_st.edges['st0', 0]['weight'] < 5000)
+
+    def test_insert_nodes(self):
+        """tests insert_nodes method"""
+        gr_simplemap = self.gr_simplemap.copy()
+        gr_insert = gr_simplemap.copy()
+        stations = gpd.GeoSeries([Point(3.5, 47), Point(0, 46), paris], crs=4326).to_crs(2154)
+        id_edges = [(0, 1), (3, 2), (2, 0)]
+        dists = gr_simplemap.insert_nodes(stations, ['st0', 'st1', 'st2'], id_edges)
+        for geom, id_node, id_edge in zip(stations, ['st0', 'st1', 'st2'], id_edges):
+            self.assertEqual(gr_insert.insert_node(geom, id_node, id_edge), dists[id_node])
+        self.assertIsNone(dists['st2'])
+        self.assertTrue(graphs_equal(gr_simplemap, gr_insert))
+        self.assertEqual(len(gr_simplemap.edges), 6)
+        line = gr_simplemap.edges[0, 'st0']['geometry']
+        points = [line.interpolate(0.6, normalized=True), line.interpolate(0.3, normalized=True)]
+        gr_simplemap.insert_nodes(points, ['st3', 'st4'], [(0, 'st0'), ('st0', 0)])
+        gr_insert.insert_node(points[1], 'st4', (0, 'st0'))
+        gr_insert.insert_node(points[0], 'st3', ('st4', 'st0'))
+        self.assertTrue(graphs_equal(gr_simplemap, gr_insert))
+        self.assertEqual(nx.shortest_path(gr_simplemap, 0, 'st0'), [0, 'st4', 'st3', 'st0'])
+        gr_nearest = self.gr_simplemap.copy()
+        dists = gr_nearest.insert_nodes(stations, ['st0', 'st1', 'st2'], max_distance=1e5)
+        self.assertTrue(dists['st0'] and dists['st1'] and dists['st2'] is None)
+        self.assertTrue(gr_nearest.has_edge(0, 'st0') and gr_nearest.has_edge('st1', 2))
+
+    def test_weight_extend_batch(self):
+        """tests weight_extend_batch method"""
+        gr_simplemap = self.gr_simplemap
+        ext_gr = gr_simplemap.subgraph([0, 3])
+        weights = gr_simplemap.weight_extend_batch(gr_simplemap.edges, ext_gr, radius=1e6)
+        for edge in gr_simplemap.edges:
+            self.assertEqual(weights[edge], gr_simplemap.weight_extend(edge, ext_gr, radius=1e6))
+        self.assertTrue(all(weight is None for weight in
+                            gr_simplemap.weight_extend_batch(gr_simplemap.edges, ext_gr).values()))
+
+    def test_weight_extend_budget(self):
+        """tests the budget parameter of weight_extend method"""
+        gr_path = gnx.GeoGraph()
+        nx.add_path(gr_path, range(5), weight=1.0)
+        ext_gr = gr_path.subgraph([0, 4])
+        weight = gr_path.weight_extend((1, 2), ext_gr, radius=10)
+        self.assertEqual(weight, 4.0)
+        self.assertEqual(gr_path.weight_extend((1, 2), ext_gr, radius=10, budget=4), weight)
+        self.assertIsNone(gr_path.weight_extend((1, 2), ext_gr, radius=10, budget=3.5))
+        self.assertIsNone(gr_path.weight_extend((1, 2), ext_gr, radius=10, budget=1))
+        gr_path.nodes[2]['d'] = 2.0
+        self.assertEqual(gr_path.weight_extend((1, 2), ext_gr, 10, 'd', budget=4), weight)
+        self.assertIsNone(gr_path.weight_extend((1, 2), ext_gr, 10, 'd', budget=3.5))
+
+    def test_weight_node_to_graph(self):
+        """tests weight_node_to_graph method"""
+        gr_path = gnx.GeoGraph()
+        nx.add_path(gr_path, range(4), weight=1.0)
+        self.assertEqual(gr_path.weight_node_to_graph(0, gr_path.subgraph([3]), 10, 'd'), 3.0)
+        self.assertEqual(gr_path.weight_node_to_graph(0, gr_path.subgraph([1]), 10, 'd'), 1.0)
+        self.assertIsNone(gr_path.weight_node_to_graph(0, gr_path.subgraph([3]), 1, 'd'))
+        self.assertEqual(gr_path.nodes[0]['d'], 1.0)
+
+    def test_compose_all(self):
+        """tests compose_all function"""
+        gr_1 = gnx.from_geopandas_edgelist(simplemap[:2])
+        gr_2 = gnx.from_geopandas_edgelist(simplemap[2:])
+        gr_all = gnx.compose_all([gr_1, gr_2])
+        self.assertTrue(graphs_equal(gr_all, gnx.compose(gr_1, gr_2)))
+        self.assertEqual(gr_all.graph['crs'], gr_1.graph['crs'])
+        gr_2.graph['crs'] = 4326
+        with self.assertRaises(gnx.geograph.GeoGraphError):
+            gnx.compose_all([gr_1, gr_2])
 
 class TestUtils(unittest.TestCase):
     """tests utils module"""
@@ -42,25 +172,35 @@ class TestUtils(unittest.TestCase):
         tests2 = [ 'x1', [1, 'x2']]
         tests3 = [None, [1, None]]
         for test in tests:
-            self.assertTrue(utils.cast_id(test) in (1, [1,2]))
-            self.assertEqual(utils.cast_id(test, True), utils.cast_id(test))
+            with self.subTest(test=test):
+                self.assertIn(utils.cast_id(test), (1, [1,2]))
+                self.assertEqual(utils.cast_id(test, True), utils.cast_id(test))
         for test in tests2:
-            self.assertEqual(utils.cast_id(test), test)
-            self.assertTrue(utils.cast_id(test, True) in (None, [1]))
+            with self.subTest(test=test):
+                self.assertEqual(utils.cast_id(test), test)
+                self.assertIn(utils.cast_id(test, True), (None, [1]))
         for test in tests3:
-            self.assertTrue(utils.cast_id(test, True) in (None, [1]))
-            self.assertTrue(utils.cast_id(test, True) in (None, [1]))
+            with self.subTest(test=test):
+                self.assertIn(utils.cast_id(test, True), (None, [1]))
+
+    def test_nodes_gdf_from_edges_gdf(self):
+        """tests nodes_gdf_from_edges_gdf function"""
+        edges = gpd.GeoDataFrame({'source': [1, 2], 'target': [2, 3], 'geometry': [
+            MultiLineString([[(0, 0), (1, 0)], [(1, 0), (2, 0)]]), LineString([(2, 0), (3, 0)])]},
+            crs=2154)
+        gr_mls = gnx.from_geopandas_edgelist(edges, node_id='node_id')
+        self.assertEqual(dict(gr_mls.nodes(data='geometry')),
+                         {1: Point(0, 0), 2: Point(2, 0), 3: Point(3, 0)})
+        n_gdf, e_gdf = utils.nodes_gdf_from_edges_gdf(edges[['geometry']], 'source', 'target')
+        self.assertEqual(list(n_gdf.geometry), [Point(0, 0), Point(2, 0), Point(3, 0)])
+        self.assertEqual(list(zip(e_gdf.source, e_gdf.target)), [(0, 1), (1, 2)])
+        edges = gpd.GeoDataFrame({'geometry': [LineString([(0, 0), (1, 0)]), None,
+                                               LineString([(5, 5), (6, 6)])]}, crs=2154)
+        with self.assertRaises(ValueError):
+            utils.nodes_gdf_from_edges_gdf(edges, 'source', 'target')
 
     def test_geo_merge(self):
         """ test geo_merge function"""
-        l1 = LineString([(0,0), (1,1), (2,2)])            
-        l1r = LineString([(2,2), (1,1), (0,0)])     
-        l1s = LineString([(3,3), (4,4), (5,5)])    
-        l1jr = LineString([(0,0), (6,6)])            
-        l1j = LineString([(-1,-1), (0,0)])            
-        l1c = LineString([(0, 2), (2, 0)])    
-        pt1 = Point((1.5, 1.5))
-        pt1e = Point((1.5, 2.5))
         self.assertTrue(utils.geo_merge(l1, l1r) is not None)
         self.assertTrue(utils.geo_merge(l1j, l1c) is not None)
         self.assertTrue(utils.geo_merge(l1s, l1jr) is None)